@@ -1,13 +1,14 @@
 """Public package interface for ChromoRetriever."""
 
 from .api import NCBIDatasetsClient, process_genome_ids
-from .export import export_records
+from .export import RecordWriter, export_records
 from .models import ChromosomeRecord, FetchResult
 
 __all__ = [
     "ChromosomeRecord",
     "FetchResult",
     "NCBIDatasetsClient",
+    "RecordWriter",
     "export_records",
     "process_genome_ids",
 ]
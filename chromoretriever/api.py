@@ -1,13 +1,70 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Sequence
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .export import export_records
+from .export import RecordWriter
 from .models import ChromosomeRecord, FetchResult
 from .utils import chromosome_sort_key, normalize_excluded_columns
 
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - optional speedup
+    import json as _json
+
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# NCBI allows 3 requests per second anonymously and 10 with an API key.
+_ANONYMOUS_RATE_LIMIT = 3.0
+_API_KEY_RATE_LIMIT = 10.0
+
+# Threads shared by all fetch_chromosome_table calls for organism lookups.
+_LOOKUP_WORKERS = 8
+
+
+def _build_session(pool_size: int = 32, max_retries: int = 5) -> requests.Session:
+    """Create a session that keeps connections alive and retries transient failures."""
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=_RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+class _RateLimiter:
+    """Space out request start times so that at most ``rate`` requests begin per second."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class NCBIDatasetsClient:
     """Client for retrieving chromosome-level sequence reports from NCBI Datasets."""
@@ -18,45 +75,75 @@ class NCBIDatasetsClient:
         timeout: int = 30,
         user_agent: str = "ChromoRetriever/0.1.0",
         session: Optional[requests.Session] = None,
+        page_size: int = 1000,
+        api_key: Optional[str] = None,
+        requests_per_second: Optional[float] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = session or requests.Session()
+        self.page_size = page_size
+        self.api_key = api_key or os.environ.get("NCBI_API_KEY") or None
+        self.session = session or _build_session()
         self.session.headers.update(
             {
                 "Accept": "application/json",
                 "User-Agent": user_agent,
             }
         )
+        if self.api_key:
+            self.session.headers["api-key"] = self.api_key
+
+        if requests_per_second is None:
+            requests_per_second = _API_KEY_RATE_LIMIT if self.api_key else _ANONYMOUS_RATE_LIMIT
+        self._rate_limiter = _RateLimiter(requests_per_second)
+        self._organism_names: Dict[str, str] = {}
+        self._lookup_executor = ThreadPoolExecutor(
+            max_workers=_LOOKUP_WORKERS, thread_name_prefix="chromoretriever-lookup"
+        )
 
     def _get_json(self, endpoint: str, params: Optional[Dict[str, object]] = None) -> Dict[str, object]:
+        self._rate_limiter.wait()
         response = self.session.get(f"{self.base_url}{endpoint}", params=params, timeout=self.timeout)
         response.raise_for_status()
-        data = response.json()
+        data = _json.loads(response.content)
         if not isinstance(data, dict):
             raise ValueError("Unexpected API response payload")
         return data
 
-    def fetch_all_sequence_reports(self, genome_id: str) -> List[Dict[str, object]]:
+    def iter_sequence_reports(self, genome_id: str) -> Iterator[Dict[str, object]]:
+        """Yield sequence reports page by page, so only one page is held in memory."""
         endpoint = f"/genome/accession/{genome_id}/sequence_reports"
-        reports: List[Dict[str, object]] = []
         page_token: Optional[str] = None
 
         while True:
-            params = {"page_token": page_token} if page_token else None
+            params: Dict[str, object] = {"page_size": self.page_size}
+            if page_token:
+                params["page_token"] = page_token
             payload = self._get_json(endpoint, params=params)
             current_reports = payload.get("reports", [])
             if not isinstance(current_reports, list):
                 raise ValueError("Unexpected reports payload")
-            reports.extend(current_reports)
 
             page_token = payload.get("next_page_token")
-            if not page_token:
+            yield from current_reports
+
+            # An empty page cannot be followed by more reports, even if a token is returned.
+            if not page_token or not current_reports:
                 break
 
-        return reports
+    def fetch_all_sequence_reports(self, genome_id: str) -> List[Dict[str, object]]:
+        return list(self.iter_sequence_reports(genome_id))
 
     def fetch_organism_name(self, genome_id: str) -> str:
+        cached = self._organism_names.get(genome_id)
+        if cached is not None:
+            return cached
+
+        organism_name = self._fetch_organism_name(genome_id)
+        self._organism_names[genome_id] = organism_name
+        return organism_name
+
+    def _fetch_organism_name(self, genome_id: str) -> str:
         endpoint = f"/genome/accession/{genome_id}/dataset_report"
         payload = self._get_json(endpoint)
         reports = payload.get("reports", [])
@@ -73,44 +160,71 @@ class NCBIDatasetsClient:
 
         return str(organism.get("organism_name", "Unknown"))
 
-    def fetch_chromosome_table(
-        self,
-        genome_id: str,
-        include_unplaced: bool = False,
-    ) -> FetchResult:
-        reports = self.fetch_all_sequence_reports(genome_id)
-        organism_name = self.fetch_organism_name(genome_id)
-
-        records: List[ChromosomeRecord] = []
-        for sequence in reports:
+    def _select_sequences(
+        self, genome_id: str, include_unplaced: bool
+    ) -> List[Tuple[str, Dict[str, object]]]:
+        selected: List[Tuple[str, Dict[str, object]]] = []
+        append_selected = selected.append
+        for sequence in self.iter_sequence_reports(genome_id):
             if not isinstance(sequence, dict):
                 continue
 
-            assigned_location = sequence.get("assigned_molecule_location_type", "")
-            role = sequence.get("role", "")
-            is_chromosome = assigned_location == "Chromosome"
-            is_assembled = role == "assembled-molecule"
-
-            if not is_chromosome and not (include_unplaced and is_assembled):
+            get = sequence.get
+            # Only non-chromosome sequences need their role checked.
+            if get("assigned_molecule_location_type") != "Chromosome" and not (
+                include_unplaced and get("role") == "assembled-molecule"
+            ):
                 continue
 
-            chromosome_name = str(sequence.get("chr_name") or sequence.get("assigned_molecule") or "N/A")
+            chromosome_name = str(get("chr_name") or get("assigned_molecule") or "N/A")
             if not include_unplaced and chromosome_name == "Un":
                 continue
 
-            gc_content = sequence.get("gc_percent")
+            append_selected((chromosome_name, sequence))
+
+        return selected
+
+    def fetch_chromosome_table(
+        self,
+        genome_id: str,
+        include_unplaced: bool = False,
+    ) -> FetchResult:
+        # The dataset_report lookup is independent of the sequence report pages, so an
+        # uncached lookup runs on the client's shared executor alongside the pagination.
+        organism_name: Optional[str] = self._organism_names.get(genome_id)
+        organism_future = (
+            self._lookup_executor.submit(self.fetch_organism_name, genome_id)
+            if organism_name is None
+            else None
+        )
+
+        try:
+            selected = self._select_sequences(genome_id, include_unplaced)
+        except BaseException:
+            if organism_future is not None:
+                organism_future.cancel()
+            raise
+
+        if organism_future is not None:
+            organism_name = organism_future.result()
+
+        records: List[ChromosomeRecord] = []
+        for chromosome_name, sequence in selected:
+            get = sequence.get
+            gc_content = get("gc_percent")
             gc_value = round(float(gc_content), 1) if gc_content is not None else None
 
-            record = ChromosomeRecord(
-                genome_id=genome_id,
-                taxon=organism_name,
-                chromosome=chromosome_name,
-                genbank=str(sequence.get("genbank_accession", "N/A")),
-                refseq=str(sequence.get("refseq_accession", "N/A")),
-                size_bp=int(sequence.get("length", 0) or 0),
-                gc_content_percent=gc_value,
+            records.append(
+                ChromosomeRecord(
+                    genome_id=genome_id,
+                    taxon=organism_name,
+                    chromosome=chromosome_name,
+                    genbank=str(get("genbank_accession", "N/A")),
+                    refseq=str(get("refseq_accession", "N/A")),
+                    size_bp=int(get("length", 0) or 0),
+                    gc_content_percent=gc_value,
+                )
             )
-            records.append(record)
 
         records.sort(key=lambda item: chromosome_sort_key(item.chromosome))
         return FetchResult(genome_id=genome_id, organism_name=organism_name, records=records)
@@ -123,32 +237,53 @@ def process_genome_ids(
     exclude_columns: Sequence[str] | None = None,
     fmt: str = "csv",
     client: Optional[NCBIDatasetsClient] = None,
+    max_workers: int = 5,
 ) -> List[FetchResult]:
     active_client = client or NCBIDatasetsClient()
     normalized_exclusions = normalize_excluded_columns(exclude_columns)
+    accessions = [genome_id.strip() for genome_id in genome_ids if genome_id.strip()]
+
+    def fetch(accession: str) -> FetchResult:
+        return active_client.fetch_chromosome_table(accession, include_unplaced=include_unplaced)
 
     results: List[FetchResult] = []
-    for genome_id in genome_ids:
-        accession = genome_id.strip()
-        if not accession:
-            continue
-
-        result = active_client.fetch_chromosome_table(
-            accession,
-            include_unplaced=include_unplaced,
+    # Rows are streamed to a sibling file that only replaces output_path once every
+    # genome has been fetched, so a failed batch never leaves a partial export behind.
+    part_path = Path(f"{output_path}.part") if output_path else None
+    output = (
+        RecordWriter(
+            part_path,
+            fmt=fmt,
+            exclude_columns=normalized_exclusions,
+            compress=str(output_path).lower().endswith(".gz"),
         )
-        results.append(result)
-
-    if output_path:
-        append = False
-        for result in results:
-            export_records(
-                result.records,
-                output_path=output_path,
-                fmt=fmt,
-                append=append,
-                exclude_columns=normalized_exclusions,
-            )
-            append = True
+        if part_path
+        else nullcontext()
+    )
+    try:
+        with output as writer, ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            # Repeated accessions share one fetch. Results are consumed in input order, and
+            # each one is written while later fetches are still in flight.
+            futures = {
+                accession: executor.submit(fetch, accession)
+                for accession in dict.fromkeys(accessions)
+            }
+            try:
+                for accession in accessions:
+                    result = futures[accession].result()
+                    results.append(result)
+                    if writer is not None:
+                        writer.write_records(result.records)
+            finally:
+                # On failure, drop queued fetches instead of letting the executor drain them.
+                for future in futures.values():
+                    future.cancel()
+    except BaseException:
+        if part_path is not None:
+            part_path.unlink(missing_ok=True)
+        raise
+
+    if part_path is not None and part_path.exists():
+        os.replace(part_path, output_path)
 
-    return results
\ No newline at end of file
+    return results
@@ -22,7 +22,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("genome_id", nargs="?", help="NCBI genome assembly accession.")
     parser.add_argument("--file", "-f", dest="input_file", help="Text file with one accession per line.")
-    parser.add_argument("--output", "-o", dest="output_file", help="Output file path.")
+    parser.add_argument(
+        "--output",
+        "-o",
+        dest="output_file",
+        help="Output file path. Paths ending in .gz are gzip-compressed.",
+    )
     parser.add_argument(
         "--format",
         dest="fmt",
@@ -48,6 +53,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=30,
         help="HTTP timeout in seconds.",
     )
+    parser.add_argument(
+        "--api-key",
+        dest="api_key",
+        help="NCBI API key. Defaults to the NCBI_API_KEY environment variable.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=5,
+        help="Number of genome assemblies fetched concurrently in batch mode.",
+    )
     return parser
 
 
@@ -61,7 +77,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         parser.error("Cannot specify both genome_id and --file.")
 
     exclude_columns = normalize_excluded_columns(args.exclude_columns)
-    client = NCBIDatasetsClient(timeout=args.timeout)
+    client = NCBIDatasetsClient(timeout=args.timeout, api_key=args.api_key)
 
     if args.input_file:
         with open(args.input_file, "r", encoding="utf-8") as handle:
@@ -76,6 +92,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             exclude_columns=exclude_columns,
             fmt=args.fmt,
             client=client,
+            max_workers=args.workers,
         )
         total_rows = sum(len(result.records) for result in results)
         print(f"Exported {total_rows} rows from {len(results)} genome assemblies to {output_path}")
@@ -1,9 +1,113 @@
 import csv
+import gzip
+import io
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import IO, Callable, Iterable, Optional, Sequence, Tuple
 
 from .models import ChromosomeRecord
-from .utils import DEFAULT_COLUMNS, filter_columns
+from .utils import DEFAULT_COLUMNS
+
+_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+_GZIP_COMPRESS_LEVEL = 3
+
+
+def _row_getter(fieldnames: Sequence[str]) -> Callable[[ChromosomeRecord], Tuple[object, ...]]:
+    """Build a function that reads only the exported fields of a record, in column order."""
+    if list(fieldnames) == DEFAULT_COLUMNS:
+        return ChromosomeRecord.to_tuple
+    if not fieldnames:
+        return lambda record: ()
+    if len(fieldnames) == 1:
+        single = attrgetter(fieldnames[0])
+        return lambda record: (single(record),)
+    return attrgetter(*fieldnames)
+
+
+class RecordWriter:
+    """Write chromosome records to a single CSV/TSV file that stays open between batches.
+
+    The file is opened, and the header written, on the first non-empty batch, so a
+    writer that never receives records leaves no file behind. Each batch is formatted
+    into an in-memory text buffer and written to the binary file as one encoded block.
+    Paths ending in ``.gz`` are gzip-compressed as they are written, unless ``compress``
+    says otherwise. A closed writer cannot be reused.
+    """
+
+    def __init__(
+        self,
+        output_path: str | Path,
+        fmt: str = "csv",
+        append: bool = False,
+        exclude_columns: Sequence[str] | None = None,
+        compress: Optional[bool] = None,
+    ) -> None:
+        self.path = Path(output_path)
+        self.compress = self.path.suffix.lower() == ".gz" if compress is None else compress
+        self.delimiter = "," if fmt.lower() == "csv" else "	"
+        self.append = append
+        self.exclude_columns = list(exclude_columns or [])
+        excluded_set = set(self.exclude_columns)
+        self.fieldnames = [column for column in DEFAULT_COLUMNS if column not in excluded_set]
+        self._get_row = _row_getter(self.fieldnames)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, delimiter=self.delimiter)
+        self._raw: Optional[IO[bytes]] = None
+        self._handle: Optional[IO[bytes]] = None
+        self._closed = False
+
+    def _open(self) -> IO[bytes]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        mode = "ab" if self.append else "wb"
+        self._raw = self.path.open(mode, buffering=_WRITE_BUFFER_SIZE)
+        # Append mode starts at the end of the file, so its position tells whether a header exists.
+        write_header = self._raw.tell() == 0
+
+        if self.compress:
+            self._handle = gzip.GzipFile(
+                fileobj=self._raw, mode=mode, compresslevel=_GZIP_COMPRESS_LEVEL
+            )
+        else:
+            self._handle = self._raw
+
+        if write_header:
+            self._writer.writerow(self.fieldnames)
+        return self._handle
+
+    def _flush_buffer(self, handle: IO[bytes]) -> None:
+        handle.write(self._buffer.getvalue().encode("utf-8"))
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    def write_records(self, records: Iterable[ChromosomeRecord]) -> int:
+        if self._closed:
+            # Reopening would truncate what was already written in "w" mode.
+            raise ValueError("I/O operation on closed RecordWriter")
+
+        get_row = self._get_row
+        rows = [get_row(record) for record in records]
+        if not rows:
+            return 0
+
+        handle = self._handle or self._open()
+        self._writer.writerows(rows)
+        self._flush_buffer(handle)
+        return len(rows)
+
+    def close(self) -> None:
+        if self._handle is not None and self._handle is not self._raw:
+            self._handle.close()
+        if self._raw is not None:
+            self._raw.close()
+        self._handle = None
+        self._raw = None
+        self._closed = True
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
 
 def export_records(
@@ -13,22 +117,8 @@ def export_records(
     append: bool = False,
     exclude_columns: Sequence[str] | None = None,
 ) -> Path:
-    rows = [filter_columns(record.to_dict(), exclude_columns) for record in records]
-    if not rows:
-        return Path(output_path)
-
-    delimiter = "," if fmt.lower() == "csv" else "	"
-    path = Path(output_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    fieldnames = [column for column in DEFAULT_COLUMNS if column in rows[0]]
-    mode = "a" if append else "w"
-    write_header = not append or not path.exists() or path.stat().st_size == 0
-
-    with path.open(mode, newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames, delimiter=delimiter)
-        if write_header:
-            writer.writeheader()
-        writer.writerows(rows)
-
-    return path
+    with RecordWriter(
+        output_path, fmt=fmt, append=append, exclude_columns=exclude_columns
+    ) as writer:
+        writer.write_records(records)
+    return writer.path
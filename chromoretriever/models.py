@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -23,6 +23,17 @@ class ChromosomeRecord:
             "gc_content_percent": self.gc_content_percent,
         }
 
+    def to_tuple(self) -> Tuple[object, ...]:
+        return (
+            self.genome_id,
+            self.taxon,
+            self.chromosome,
+            self.genbank,
+            self.refseq,
+            self.size_bp,
+            self.gc_content_percent,
+        )
+
 
 @dataclass(frozen=True)
 class FetchResult:
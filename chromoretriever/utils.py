@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Iterable, List, Mapping, MutableMapping, Sequence
 
 DEFAULT_COLUMNS = [
@@ -20,6 +21,8 @@ _SPECIAL_CHROMOSOMES = {
     "MITOCHONDRION": 1002,
 }
 
+_PREFIXED_NUMBER_RE = re.compile(r"^([A-Z]+)(\d+)$")
+
 
 def normalize_excluded_columns(excluded: Sequence[str] | None) -> List[str]:
     if not excluded:
@@ -31,6 +34,7 @@ def normalize_excluded_columns(excluded: Sequence[str] | None) -> List[str]:
     return normalized
 
 
+@lru_cache(maxsize=4096)
 def chromosome_sort_key(chromosome_name: str):
     name = chromosome_name.replace("chr", "").replace("Chr", "").upper()
 
@@ -42,7 +46,7 @@ def chromosome_sort_key(chromosome_name: str):
     except ValueError:
         pass
 
-    match = re.match(r"^([A-Z]+)(\d+)$", name)
+    match = _PREFIXED_NUMBER_RE.match(name)
     if match:
         prefix, number = match.groups()
         return (1, prefix, int(number))
@@ -0,0 +1,81 @@
+import json
+import threading
+from typing import Dict, List, Optional
+
+import pytest
+import requests
+
+from chromoretriever.api import NCBIDatasetsClient
+
+
+class FakeResponse:
+    def __init__(self, payload: object, status_code: int = 200) -> None:
+        self.content = json.dumps(payload).encode("utf-8")
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Client Error")
+
+
+def make_report(chr_name: str, index: int = 0, location: str = "Chromosome") -> Dict[str, object]:
+    return {
+        "chr_name": chr_name,
+        "assigned_molecule_location_type": location,
+        "role": "assembled-molecule",
+        "genbank_accession": f"CM{index:06d}.1",
+        "refseq_accession": f"NC_{index:06d}.1",
+        "length": 1000 + index,
+        "gc_percent": 36.04,
+    }
+
+
+class FakeSession:
+    """Stand-in for requests.Session serving two pages of sequence reports per genome."""
+
+    def __init__(self, failing: Optional[set] = None) -> None:
+        self.headers: Dict[str, str] = {}
+        self.failing = failing or set()
+        self.calls: List[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params=None, timeout=None) -> FakeResponse:
+        with self._lock:
+            self.calls.append(url)
+        genome_id = url.split("/")[-2]
+        if genome_id in self.failing:
+            return FakeResponse({}, status_code=404)
+
+        if url.endswith("/dataset_report"):
+            return FakeResponse(
+                {"reports": [{"organism": {"organism_name": f"Organism {genome_id}"}}]}
+            )
+
+        if (params or {}).get("page_token"):
+            return FakeResponse(
+                {"reports": [make_report("X", 3), make_report("Un", 4, location="")]}
+            )
+        return FakeResponse(
+            {
+                "reports": [make_report("10", 0), make_report("2", 1), make_report("1", 2)],
+                "next_page_token": "page-2",
+            }
+        )
+
+    def genomes_requested(self) -> List[str]:
+        return [url.split("/")[-2] for url in self.calls]
+
+
+@pytest.fixture
+def fake_session_cls() -> type:
+    return FakeSession
+
+
+@pytest.fixture
+def session() -> FakeSession:
+    return FakeSession()
+
+
+@pytest.fixture
+def client(session: FakeSession) -> NCBIDatasetsClient:
+    return NCBIDatasetsClient(session=session, requests_per_second=0)
@@ -0,0 +1,88 @@
+import time
+
+import pytest
+import requests
+
+import chromoretriever.api as api
+from chromoretriever import NCBIDatasetsClient, process_genome_ids
+
+
+def test_fetch_chromosome_table_filters_and_sorts(client):
+    result = client.fetch_chromosome_table("GCF_1")
+
+    assert result.organism_name == "Organism GCF_1"
+    assert [record.chromosome for record in result.records] == ["1", "2", "10", "X"]
+    assert result.records[0].gc_content_percent == 36.0
+
+
+def test_rate_limiter_spaces_request_starts(monkeypatch, fake_session_cls):
+    clock = [100.0]
+    starts = []
+
+    class RecordingSession(fake_session_cls):
+        def get(self, url, params=None, timeout=None):
+            starts.append(clock[0])
+            return super().get(url, params=params, timeout=timeout)
+
+    monkeypatch.setattr(api.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(api.time, "sleep", lambda seconds: clock.__setitem__(0, clock[0] + seconds))
+
+    client = NCBIDatasetsClient(session=RecordingSession(), requests_per_second=4)
+    client.fetch_all_sequence_reports("GCF_1")
+    client.fetch_organism_name("GCF_1")
+
+    assert [round(start - starts[0], 6) for start in starts] == [0.0, 0.25, 0.5]
+
+
+def test_rate_limit_defaults_depend_on_api_key(monkeypatch, fake_session_cls):
+    monkeypatch.delenv("NCBI_API_KEY", raising=False)
+    anonymous = NCBIDatasetsClient(session=fake_session_cls())
+    keyed = NCBIDatasetsClient(session=fake_session_cls(), api_key="secret")
+
+    assert anonymous._rate_limiter._interval == pytest.approx(1 / 3)
+    assert keyed._rate_limiter._interval == pytest.approx(1 / 10)
+    assert keyed.session.headers["api-key"] == "secret"
+    assert "api-key" not in anonymous.session.headers
+
+
+def test_repeated_accessions_are_fetched_once_in_input_order(client, session):
+    results = process_genome_ids(["GCF_2", "GCF_1", " ", "GCF_2"], client=client, max_workers=3)
+
+    assert [result.genome_id for result in results] == ["GCF_2", "GCF_1", "GCF_2"]
+    assert results[0] is results[2]
+    requested = session.genomes_requested()
+    # Two sequence report pages plus one dataset_report per distinct genome.
+    assert requested.count("GCF_2") == 3
+    assert requested.count("GCF_1") == 3
+
+
+def test_failure_cancels_queued_fetches_and_keeps_existing_output(tmp_path, fake_session_cls):
+    class SlowSession(fake_session_cls):
+        def get(self, url, params=None, timeout=None):
+            time.sleep(0.01)
+            return super().get(url, params=params, timeout=timeout)
+
+    session = SlowSession(failing={"GCF_1"})
+    client = NCBIDatasetsClient(session=session, requests_per_second=0)
+    output_path = tmp_path / "chromosomes.csv"
+    output_path.write_text("previous export\n", encoding="utf-8")
+    accessions = [f"GCF_{index}" for index in range(10)]
+
+    with pytest.raises(requests.HTTPError):
+        process_genome_ids(accessions, output_path=str(output_path), client=client, max_workers=1)
+
+    assert set(session.genomes_requested()) <= {"GCF_0", "GCF_1", "GCF_2"}
+    assert output_path.read_text(encoding="utf-8") == "previous export\n"
+    assert not (tmp_path / "chromosomes.csv.part").exists()
+
+
+def test_batch_output_replaces_file_on_success(client, tmp_path):
+    output_path = tmp_path / "chromosomes.tsv"
+    output_path.write_text("previous export\n", encoding="utf-8")
+
+    process_genome_ids(["GCF_1", "GCF_2"], output_path=str(output_path), fmt="tsv", client=client)
+
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].split("\t")[0] == "genome_id"
+    assert len(lines) == 1 + 2 * 4
+    assert not (tmp_path / "chromosomes.tsv.part").exists()
@@ -0,0 +1,78 @@
+import csv
+import gzip
+import io
+
+import pytest
+
+from chromoretriever import ChromosomeRecord, RecordWriter, export_records
+from chromoretriever.utils import DEFAULT_COLUMNS, filter_columns
+
+RECORDS = [
+    ChromosomeRecord("GCF_1", "Homo sapiens", "1", "CM000663.2", "NC_000001.11", 248956422, 41.8),
+    ChromosomeRecord("GCF_1", 'Taxon, "quoted"', "X", "N/A", "N/A", 0, None),
+    ChromosomeRecord("GCF_1", "Ünicode", "MT", "J01415.2", "NC_012920.1", 16569, 44.4),
+]
+
+
+def dict_writer_bytes(records, delimiter=",", exclude_columns=None):
+    """Output of the original DictWriter-based export, used as the reference."""
+    rows = [filter_columns(record.to_dict(), exclude_columns) for record in records]
+    handle = io.StringIO(newline="")
+    fieldnames = [column for column in DEFAULT_COLUMNS if column in rows[0]]
+    writer = csv.DictWriter(handle, fieldnames=fieldnames, delimiter=delimiter)
+    writer.writeheader()
+    writer.writerows(rows)
+    return handle.getvalue().encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    ("fmt", "delimiter", "exclude_columns"),
+    [
+        ("csv", ",", None),
+        ("csv", ",", ["refseq", "gc_content_percent"]),
+        ("tsv", "\t", ["taxon"]),
+        ("csv", ",", [column for column in DEFAULT_COLUMNS if column != "gc_content_percent"]),
+    ],
+)
+def test_export_matches_dict_writer_output(tmp_path, fmt, delimiter, exclude_columns):
+    path = export_records(
+        RECORDS, tmp_path / f"out.{fmt}", fmt=fmt, exclude_columns=exclude_columns
+    )
+
+    assert path.read_bytes() == dict_writer_bytes(RECORDS, delimiter, exclude_columns)
+
+
+def test_append_writes_header_once(tmp_path):
+    path = tmp_path / "out.csv"
+    export_records(RECORDS[:1], path, append=True)
+    export_records(RECORDS[1:], path, append=True)
+
+    assert path.read_bytes() == dict_writer_bytes(RECORDS)
+
+
+def test_gzip_round_trip_with_append(tmp_path):
+    path = tmp_path / "out.csv.gz"
+    export_records(RECORDS[:1], path)
+    export_records(RECORDS[1:], path, append=True)
+
+    with gzip.open(path, "rb") as handle:
+        assert handle.read() == dict_writer_bytes(RECORDS)
+
+
+def test_empty_batches_create_no_file(tmp_path):
+    path = tmp_path / "out.csv"
+    with RecordWriter(path) as writer:
+        assert writer.write_records([]) == 0
+
+    assert not path.exists()
+
+
+def test_write_after_close_raises(tmp_path):
+    path = tmp_path / "out.csv"
+    writer = RecordWriter(path)
+    writer.write_records(RECORDS)
+    writer.close()
+
+    with pytest.raises(ValueError):
+        writer.write_records(RECORDS)
+    assert path.read_bytes() == dict_writer_bytes(RECORDS)